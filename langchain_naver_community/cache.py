@@ -0,0 +1,251 @@
+"""Caches for Naver search results."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Hashable
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+DISK_CACHE_SIZE_LIMIT = 128 * 2**20  # bytes
+
+# diskcache.Cache instances by directory, opened on first use
+_DISK_CACHES: dict[str, Any] = {}
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    A ``maxsize`` of zero (or less) disables the cache: ``set`` becomes a
+    no-op and every ``get`` is a miss.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` or ``default`` if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+async def single_flight(
+    inflight: dict[Hashable, asyncio.Future],
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Await the call running for ``key``, starting it with ``factory`` if idle.
+
+    Concurrent callers with the same key share one task and its result or
+    exception. The task is awaited through ``asyncio.shield``, so cancelling
+    one caller (e.g. on a timeout) neither cancels the shared call nor the
+    other callers waiting on it. Entries are scoped to the running loop, since
+    a task cannot be awaited from another loop (e.g. ``asyncio.run`` in two
+    threads sharing one ``inflight`` map).
+    """
+    key = (asyncio.get_running_loop(), key)
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+
+        def _forget(done: asyncio.Future) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            if not done.cancelled():
+                done.exception()  # Don't log it as unretrieved if nobody waits
+
+        task.add_done_callback(_forget)
+    return await asyncio.shield(task)
+
+
+class SemanticCache:
+    """FIFO cache that matches queries by embedding cosine similarity.
+
+    Follows the GPTCache / PromptCache pattern: a lookup embeds the query,
+    scores it against every stored embedding in one matrix product and
+    returns the best entry if its similarity exceeds ``threshold``. Only
+    entries stored with identical search parameters are considered, so a
+    paraphrased query never returns results for a different search type,
+    page or sort order.
+
+    Requires ``numpy``.
+    """
+
+    def __init__(self, threshold: float = 0.95, maxsize: int = 256) -> None:
+        try:
+            import numpy as np
+        except ImportError as e:
+            msg = (
+                "Could not import numpy python package. "
+                "Please install it with `pip install numpy`."
+            )
+            raise ImportError(msg) from e
+
+        self._np = np
+        self.threshold = threshold
+        self._entries: deque[tuple[Any, Hashable, Any]] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def _normalize(self, embedding: Any) -> Any:
+        vector = self._np.asarray(embedding, dtype=self._np.float32).ravel()
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: Any, params: Hashable, default: Any = None) -> Any:
+        """Return the value of the most similar entry stored with ``params``."""
+        with self._lock:
+            entries = [entry for entry in self._entries if entry[1] == params]
+        if not entries:
+            return default
+
+        np = self._np
+        matrix = np.stack([entry[0] for entry in entries])
+        scores = np.matmul(matrix, self._normalize(embedding))
+        best = int(np.argmax(scores))
+        if scores[best] > self.threshold:
+            return entries[best][2]
+        return default
+
+    def set(self, embedding: Any, params: Hashable, value: Any) -> None:
+        """Store ``value``, dropping the oldest entry when full."""
+        with self._lock:
+            self._entries.append((self._normalize(embedding), params, value))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@functools.lru_cache(maxsize=None)
+def default_embedder(
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+) -> Callable[[str], Any]:
+    """Build a multilingual sentence-transformers embedder.
+
+    Models are loaded once per process and shared by every caller.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        msg = (
+            "Could not import sentence_transformers python package. "
+            "Please install it with `pip install sentence-transformers` "
+            "or pass a custom `embedder`."
+        )
+        raise ImportError(msg) from e
+
+    model = SentenceTransformer(model_name)
+    return model.encode
+
+
+def get_disk_cache(directory: str) -> Any:
+    """Return the ``diskcache.Cache`` for ``directory``, opening it once."""
+    cache = _DISK_CACHES.get(directory)
+    if cache is None:
+        try:
+            import diskcache
+        except ImportError as e:
+            msg = (
+                "Could not import diskcache python package. "
+                "Please install it with `pip install diskcache`."
+            )
+            raise ImportError(msg) from e
+
+        cache = diskcache.Cache(directory, size_limit=DISK_CACHE_SIZE_LIMIT)
+        _DISK_CACHES[directory] = cache
+    return cache
+
+
+def disk_cache_key(key: tuple) -> str:
+    """Hash a cache key tuple into a short, stable string."""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+class ZstdCodec:
+    """Compresses cached results to zstd-framed JSON and back.
+
+    Compressor and decompressor objects are reused, one pair per thread,
+    since zstandard does not allow sharing an instance between threads
+    concurrently. Requires ``zstandard``.
+    """
+
+    def __init__(self, level: int = 3) -> None:
+        try:
+            import zstandard
+        except ImportError as e:
+            msg = (
+                "Could not import zstandard python package. "
+                "Please install it with `pip install zstandard`."
+            )
+            raise ImportError(msg) from e
+
+        self._zstd = zstandard
+        self.level = level
+        self._local = threading.local()
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize ``value`` to JSON and compress it."""
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._zstd.ZstdCompressor(level=self.level)
+            self._local.compressor = compressor
+        return compressor.compress(_json_dumps(value))
+
+    def decode(self, data: Any) -> Any:
+        """Decompress and parse ``data``; values that are not bytes pass through."""
+        if not isinstance(data, bytes):
+            return data
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._zstd.ZstdDecompressor()
+            self._local.decompressor = decompressor
+        return _json_loads(decompressor.decompress(data))
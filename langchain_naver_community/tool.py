@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
+import aiohttp
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
-from typing_extensions import Literal
-
-from langchain_naver_community.utils import NaverSearchAPIWrapper
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from typing_extensions import Literal, Self
+
+from langchain_naver_community.cache import (
+    SemanticCache,
+    TTLCache,
+    ZstdCodec,
+    default_embedder,
+    disk_cache_key,
+    get_disk_cache,
+    single_flight,
+)
+from langchain_naver_community.utils import REQUEST_TIMEOUT, NaverSearchAPIWrapper
 
 if TYPE_CHECKING:
     from langchain_core.callbacks import (
@@ -21,9 +34,53 @@ if TYPE_CHECKING:
 class NaverInput(BaseModel):
     """Input for the Naver search tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(description="search query to look up")
 
 
+_NAVER_INPUT_ADAPTER = TypeAdapter(NaverInput)
+
+
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def _parse_pub_date(pub_date: str) -> tuple[int, int, int]:
+    """Return ``(year, month, day)`` of an RFC 822 ``pubDate``.
+
+    Naver formats it as ``"Tue, 10 Dec 2024 09:30:00 +0900"``; splitting on
+    spaces and looking the month up is much cheaper than ``strptime``.
+    """
+    _, day, month, year = pub_date.split(" ", 4)[:4]
+    return int(year), _MONTHS[month], int(day)
+
+
+def _matches_date(result: dict, target_ymd: tuple[int, int, int]) -> bool:
+    """Check whether a result was published on the target date.
+
+    Results without a parsable ``pubDate`` are kept.
+    """
+    if "pubDate" not in result:
+        return True
+    try:
+        return _parse_pub_date(result["pubDate"]) == target_ymd
+    except (ValueError, KeyError):
+        return True
+
+
 class NaverNewsInput(BaseModel):
     """Input for the Naver news search tool with date filtering."""
 
@@ -38,6 +95,62 @@ class NaverNewsInput(BaseModel):
     )
 
 
+def _copy_results(results: list[dict]) -> list[dict]:
+    """Copy results so callers cannot modify the cached ones."""
+    return [dict(result) for result in results]
+
+
+def _format_error(error: Exception) -> str:
+    """Format an exception for the tool output, identically to ``repr``.
+
+    Builds the string directly for the common single-argument case instead
+    of going through ``BaseException.__repr__``.
+    """
+    args = error.args
+    if len(args) == 1 and type(error).__repr__ is BaseException.__repr__:
+        return f"{type(error).__name__}({args[0]!r})"
+    return repr(error)
+
+
+# Fields captured by NaverSearchResults' pre-bound API calls
+_BOUND_FIELDS = frozenset({"api_wrapper", "search_type", "display", "start", "sort"})
+
+
+@functools.lru_cache(maxsize=None)
+def _reader_codec() -> ZstdCodec:
+    """Codec for reading compressed entries when compression is off."""
+    return ZstdCodec()
+
+
+class _ByIdentity:
+    """Hashable wrapper matching a pydantic model argument by identity.
+
+    The memoized key holds the wrapper, so the model stays alive and its
+    ``id`` cannot be reused by another object while the entry is cached.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ByIdentity) and other.value is self.value
+
+
+@functools.lru_cache(maxsize=32)
+def _get_cached_tool(cls: type[NaverSearchResults], kwargs: frozenset) -> BaseTool:
+    return cls(
+        **{
+            name: value.value if isinstance(value, _ByIdentity) else value
+            for name, value in kwargs
+        }
+    )
+
+
 class NaverSearchResults(BaseTool):
     """Tool that queries the Naver Search API and gets back json.
 
@@ -68,6 +181,31 @@ class NaverSearchResults(BaseTool):
         .. code-block:: python
 
             tool.invoke({'query': '최신 한국 뉴스'})  # For Korean news
+
+    Caching:
+        Results are kept in an in-process TTL cache keyed on the query and the
+        search parameters, so repeated queries skip the HTTP round-trip.
+        Concurrent async calls for the same key share a single request. Each
+        call gets its own copy of the results, so callers may modify them.
+        Tune with ``cache_ttl`` (seconds) and ``cache_size`` (entries); set
+        ``cache_size=0`` to disable.
+
+        With ``semantic_cache=True`` an additional layer reuses results for
+        paraphrased queries (e.g. "최신 뉴스" and "최근 뉴스") whose embedding
+        cosine similarity exceeds ``semantic_threshold``. ``embedder`` maps a
+        query to a vector and defaults to a multilingual sentence-transformers
+        model, loaded on the first semantic lookup and shared by all tools;
+        this layer requires ``numpy``.
+
+        Set ``disk_cache_dir`` (or the ``NAVER_DISK_CACHE_DIR`` environment
+        variable) to also persist results on disk for ``disk_cache_ttl``
+        seconds, so they survive process restarts. This requires
+        ``diskcache``.
+
+        With ``compress_cache=True`` every cache layer stores results as
+        zstd-compressed JSON, trading a little CPU per hit for a several-fold
+        smaller footprint with large ``display`` values. This requires
+        ``zstandard``.
     """
 
     name: str = "naver_search_results_json"
@@ -86,6 +224,213 @@ class NaverSearchResults(BaseTool):
     max_search_attempts: int = (
         10  # Maximum number of API calls to prevent infinite loops
     )
+    cache_ttl: int = 300
+    cache_size: int = 512
+    semantic_cache: bool = False
+    semantic_threshold: float = 0.95
+    embedder: Callable[[str], Any] | None = None
+    disk_cache_dir: str | None = Field(
+        default_factory=lambda: os.environ.get("NAVER_DISK_CACHE_DIR")
+    )
+    disk_cache_ttl: int = 3600
+    compress_cache: bool = False
+
+    _cache: TTLCache = PrivateAttr()
+    _inflight: dict[tuple, asyncio.Future] = PrivateAttr(default_factory=dict)
+    _semantic: SemanticCache | None = PrivateAttr(default=None)
+    _disk_cache: Any = PrivateAttr(default=None)
+    _codec: ZstdCodec | None = PrivateAttr(default=None)
+    _params: tuple = PrivateAttr()
+    _call: Callable[..., list[dict]] = PrivateAttr()
+    _acall: Callable[..., Any] = PrivateAttr()
+
+    def model_post_init(self, context: Any) -> None:
+        """Bind the API calls and create the result caches."""
+        super().model_post_init(context)
+        self._init_state()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the tool with its own caches and calls bound to its fields.
+
+        ``model_copy`` writes ``update`` straight to the copy's ``__dict__``
+        and carries private attributes over, which would leave the copy
+        calling the API with the original parameters and sharing its caches.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._init_state()
+        return copied
+
+    def _init_state(self) -> None:
+        """Bind the API calls and create fresh result caches."""
+        self._bind_calls()
+        self._cache = TTLCache(maxsize=self.cache_size, ttl=self.cache_ttl)
+        self._inflight = {}
+        self._semantic = None
+        if self.semantic_cache:
+            self._semantic = SemanticCache(threshold=self.semantic_threshold)
+        self._disk_cache = None
+        if self.disk_cache_dir:
+            self._disk_cache = get_disk_cache(self.disk_cache_dir)
+        self._codec = ZstdCodec() if self.compress_cache else None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _BOUND_FIELDS:
+            self._bind_calls()
+
+    def _bind_calls(self) -> None:
+        """Pre-bind the search parameters, which rarely change after init."""
+        params = {
+            "search_type": self.search_type,
+            "display": self.display,
+            "start": self.start,
+            "sort": self.sort,
+        }
+        self._params = tuple(params.values())
+        self._call = functools.partial(self.api_wrapper.results, **params)
+        self._acall = functools.partial(self.api_wrapper.results_async, **params)
+
+    @classmethod
+    def get_cached(cls, **kwargs: Any) -> NaverSearchResults:
+        """Return a shared instance of this tool for the given arguments.
+
+        Instances are memoized on the class and keyword arguments (which must
+        be hashable), so repeated calls skip pydantic validation. Pydantic
+        model arguments such as ``api_wrapper`` are matched by identity, so
+        pass the same wrapper instance to get the same tool. The returned
+        tool is shared and pydantic models are mutable: changing it (e.g.
+        replacing ``api_wrapper``) affects every caller, including other
+        threads. Construct the tool directly if you need a private copy.
+        """
+        key = frozenset(
+            (name, _ByIdentity(value) if isinstance(value, BaseModel) else value)
+            for name, value in kwargs.items()
+        )
+        return _get_cached_tool(cls, key)
+
+    def _parse_input(
+        self, tool_input: str | dict[str, Any], tool_call_id: str | None
+    ) -> str | dict[str, Any]:
+        """Validate the input, skipping the generic path for ``NaverInput``."""
+        if self.args_schema is not NaverInput:
+            return super()._parse_input(tool_input, tool_call_id)
+        if isinstance(tool_input, str):
+            return tool_input
+        query = tool_input.get("query")
+        if type(query) is str:
+            # Already valid; pydantic would only copy the string
+            return {"query": query}
+        return {"query": _NAVER_INPUT_ADAPTER.validate_python(tool_input).query}
+
+    def _cache_key(self, query: str, display: int | None = None) -> tuple:
+        if display is None:
+            return (query, *self._params)
+        search_type, _, start, sort = self._params
+        return (query, search_type, display, start, sort)
+
+    def _decode(self, value: Any) -> Any:
+        """Decode a stored entry; ``bytes`` are zstd-compressed results.
+
+        Compressed entries can show up with ``compress_cache=False`` when the
+        disk cache was written by a tool with compression on. They are
+        decoded all the same, or treated as misses without ``zstandard``.
+        """
+        if not isinstance(value, bytes):
+            return value
+        if self._codec is not None:
+            return self._codec.decode(value)
+        try:
+            return _reader_codec().decode(value)
+        except ImportError:
+            return None
+
+    def _stored_lookup(self, key: tuple) -> Any:
+        """Look ``key`` up in the memory and then the disk cache."""
+        stored = self._cache.get(key)
+        if stored is not None:
+            return self._decode(stored)
+        if self._disk_cache is not None:
+            stored = self._disk_cache.get(disk_cache_key(key))
+            if stored is not None:
+                self._cache.set(key, stored)
+                return self._decode(stored)
+        return None
+
+    def _embedder(self) -> Callable[[str], Any]:
+        """Return ``embedder``, loading the shared default model on first use."""
+        return self.embedder if self.embedder is not None else default_embedder()
+
+    def _cache_lookup(self, query: str, key: tuple) -> tuple[Any, Any]:
+        """Look ``key`` up in the memory, disk and semantic caches in turn.
+
+        Returns the cached results (or ``None``) and the query embedding, which
+        is computed at most once and reused when storing a fresh result.
+        """
+        results = self._stored_lookup(key)
+        if results is not None or self._semantic is None:
+            return results, None
+        embedding = self._embedder()(query)
+        return self._decode(self._semantic.get(embedding, key[1:])), embedding
+
+    async def _acache_lookup(self, query: str, key: tuple) -> tuple[Any, Any]:
+        """Async variant of ``_cache_lookup``.
+
+        The embedder runs in the default executor so model inference does not
+        block the event loop.
+        """
+        results = self._stored_lookup(key)
+        if results is not None or self._semantic is None:
+            return results, None
+        loop = asyncio.get_running_loop()
+        embedding = await loop.run_in_executor(None, self._embedder(), query)
+        return self._decode(self._semantic.get(embedding, key[1:])), embedding
+
+    def _cache_store(self, key: tuple, embedding: Any, results: list[dict]) -> None:
+        stored = results if self._codec is None else self._codec.encode(results)
+        self._cache.set(key, stored)
+        if self._disk_cache is not None:
+            self._disk_cache.set(
+                disk_cache_key(key), stored, expire=self.disk_cache_ttl
+            )
+        if self._semantic is not None and embedding is not None:
+            self._semantic.set(embedding, key[1:], stored)
+
+    def _cached_results(self, query: str, display: int | None = None) -> list[dict]:
+        """Return results for ``query``, calling the API only on a cache miss.
+
+        ``display`` overrides the tool's own page size for this call.
+        """
+        key = self._cache_key(query, display)
+        results, embedding = self._cache_lookup(query, key)
+        if results is None:
+            extra = {} if display is None else {"display": display}
+            results = self._call(query, **extra)
+            self._cache_store(key, embedding, results)
+        return _copy_results(results)
+
+    async def _acached_results(
+        self,
+        query: str,
+        display: int | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> list[dict]:
+        """Async variant of ``_cached_results`` that coalesces in-flight calls."""
+        key = self._cache_key(query, display)
+        results, embedding = await self._acache_lookup(query, key)
+        if results is None:
+            extra: dict[str, Any] = {} if display is None else {"display": display}
+            if session is not None:
+                extra["session"] = session
+
+            async def fetch() -> list[dict]:
+                fresh = await self._acall(query, **extra)
+                self._cache_store(key, embedding, fresh)
+                return fresh
+
+            results = await single_flight(self._inflight, key, fetch)
+        return _copy_results(results)
 
     def _run(
         self,
@@ -94,15 +439,9 @@ class NaverSearchResults(BaseTool):
     ) -> list[dict] | str:
         """Use the tool."""
         try:
-            return self.api_wrapper.results(
-                query,
-                search_type=self.search_type,
-                display=self.display,
-                start=self.start,
-                sort=self.sort,
-            )
+            return self._cached_results(query)
         except Exception as e:  # noqa: BLE001
-            return repr(e)
+            return _format_error(e)
 
     async def _arun(
         self,
@@ -111,19 +450,41 @@ class NaverSearchResults(BaseTool):
     ) -> list[dict] | str:
         """Use the tool asynchronously."""
         try:
-            return await self.api_wrapper.results_async(
-                query,
-                search_type=self.search_type,
-                display=self.display,
-                start=self.start,
-                sort=self.sort,
-            )
+            return await self._acached_results(query)
         except Exception as e:  # noqa: BLE001
-            return repr(e)
+            return _format_error(e)
+
+    async def arun_many(self, queries: list[str]) -> list[list[dict] | str]:
+        """Run several queries concurrently over one connection pool.
+
+        Results are returned in the order of ``queries``. As with ``_arun``, a
+        failed query yields the ``repr`` of its exception instead of raising.
+        Callbacks are not invoked for these calls.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=20, ttl_dns_cache=300, keepalive_timeout=30
+        )
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            results = await asyncio.gather(
+                *(self._acached_results(query, session=session) for query in queries),
+                return_exceptions=True,
+            )
+        return [
+            _format_error(result) if isinstance(result, Exception) else result
+            for result in results
+        ]
 
 
 class NaverNewsSearch(NaverSearchResults):
-    """Tool specialized for Naver News search with date filtering."""
+    """Tool specialized for Naver News search with date filtering.
+
+    Searches without ``target_date`` use the result caches, keyed with
+    ``min_results`` as the page size. Date-filtered searches page through
+    the API on every call and bypass the caches.
+    """
 
     name: str = "naver_news_search"
     description: str = (
@@ -145,7 +506,7 @@ class NaverNewsSearch(NaverSearchResults):
         try:
             return self._search_with_date_filter(query, target_date, min_results)
         except Exception as e:  # noqa: BLE001
-            return repr(e)
+            return _format_error(e)
 
     async def _arun(
         self,
@@ -160,27 +521,22 @@ class NaverNewsSearch(NaverSearchResults):
                 query, target_date, min_results
             )
         except Exception as e:  # noqa: BLE001
-            return repr(e)
+            return _format_error(e)
 
     def _search_with_date_filter(
         self, query: str, target_date: str | None, min_results: int
     ) -> list[dict]:
         """Search with date filtering and duplicate removal."""
         if target_date is None:
-            # No date filtering, use original logic
-            return self.api_wrapper.results(
-                query,
-                search_type=self.search_type,
-                display=min_results,
-                start=self.start,
-                sort=self.sort,
-            )
+            # No date filtering: a plain search, served from the result caches
+            return self._cached_results(query, display=min_results)
 
         # Parse target date
         try:
             target_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {e}") from e
+        target_ymd = (target_date_obj.year, target_date_obj.month, target_date_obj.day)
 
         all_results = []
         seen_links = set()
@@ -207,25 +563,7 @@ class NaverNewsSearch(NaverSearchResults):
                 if result.get("link") in seen_links:
                     continue
 
-                # Check date if pubDate is available
-                if "pubDate" in result:
-                    try:
-                        # pubDate format: "Tue, 10 Dec 2024 09:30:00 +0900"
-                        pub_date_str = result["pubDate"]
-                        # Parse the date part only
-                        pub_date = datetime.strptime(
-                            pub_date_str.split(",")[1].split("+")[0].strip(),
-                            "%d %b %Y %H:%M:%S",
-                        ).date()
-                        if pub_date == target_date_obj:
-                            filtered_results.append(result)
-                            seen_links.add(result.get("link", ""))
-                    except (ValueError, IndexError):
-                        # If date parsing fails, include the result (fallback)
-                        filtered_results.append(result)
-                        seen_links.add(result.get("link", ""))
-                else:
-                    # If no pubDate, include the result
+                if _matches_date(result, target_ymd):
                     filtered_results.append(result)
                     seen_links.add(result.get("link", ""))
 
@@ -244,20 +582,15 @@ class NaverNewsSearch(NaverSearchResults):
     ) -> list[dict]:
         """Search with date filtering and duplicate removal (async)."""
         if target_date is None:
-            # No date filtering, use original logic
-            return await self.api_wrapper.results_async(
-                query,
-                search_type=self.search_type,
-                display=min_results,
-                start=self.start,
-                sort=self.sort,
-            )
+            # No date filtering: a plain search, served from the result caches
+            return await self._acached_results(query, display=min_results)
 
         # Parse target date
         try:
             target_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {e}") from e
+        target_ymd = (target_date_obj.year, target_date_obj.month, target_date_obj.day)
 
         all_results = []
         seen_links = set()
@@ -284,25 +617,7 @@ class NaverNewsSearch(NaverSearchResults):
                 if result.get("link") in seen_links:
                     continue
 
-                # Check date if pubDate is available
-                if "pubDate" in result:
-                    try:
-                        # pubDate format: "Tue, 10 Dec 2024 09:30:00 +0900"
-                        pub_date_str = result["pubDate"]
-                        # Parse the date part only
-                        pub_date = datetime.strptime(
-                            pub_date_str.split(",")[1].split("+")[0].strip(),
-                            "%d %b %Y %H:%M:%S",
-                        ).date()
-                        if pub_date == target_date_obj:
-                            filtered_results.append(result)
-                            seen_links.add(result.get("link", ""))
-                    except (ValueError, IndexError):
-                        # If date parsing fails, include the result (fallback)
-                        filtered_results.append(result)
-                        seen_links.add(result.get("link", ""))
-                else:
-                    # If no pubDate, include the result
+                if _matches_date(result, target_ymd):
                     filtered_results.append(result)
                     seen_links.add(result.get("link", ""))
 
@@ -6,16 +6,33 @@ https://developers.naver.com/docs/serviceapi/search/news/news.md
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
+import itertools
+import os
+import platform
+import sys
 import urllib.parse
-import urllib.request
-from typing import Any
+import warnings
+from typing import Any, AsyncGenerator
 
 import aiohttp
+import requests
 from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, SecretStr, model_validator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from langchain_naver_community.cache import single_flight
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 NAVER_API_URL = "https://openapi.naver.com/v1/search"
+REQUEST_TIMEOUT = 5  # seconds
 
 SEARCH_TYPE_MAP = {
     "news": "news",
@@ -24,12 +41,163 @@ SEARCH_TYPE_MAP = {
     "webkr": "webkr",
 }
 
+_OPTIONAL_FIELDS = ("bloggername", "postdate", "pubDate")
+
+
+def _strip_tags(text: str) -> str:
+    """Remove the ``<b>`` highlight tags Naver wraps around matched terms."""
+    if "<" not in text:
+        return text
+    return text.replace("<b>", "").replace("</b>", "")
+
+
+def _maybe_install_uvloop() -> None:
+    """Use uvloop for asyncio when ``NAVER_USE_UVLOOP=1`` is set.
+
+    This is opt-in because it replaces the event loop policy process-wide.
+    uvloop does not support Windows, where the setting is ignored. If uvloop
+    is not installed, a warning is emitted and the stock loop is kept.
+
+    Event loop policies are deprecated from Python 3.14, where the setting is
+    ignored with a warning; run your entry point with ``uvloop.run(main())``
+    or ``asyncio.Runner(loop_factory=uvloop.new_event_loop)`` instead.
+    """
+    if os.environ.get("NAVER_USE_UVLOOP") != "1" or platform.system() == "Windows":
+        return
+    if sys.version_info >= (3, 14):
+        warnings.warn(
+            "NAVER_USE_UVLOOP is ignored on Python 3.14+, where event loop "
+            "policies are deprecated. Use `uvloop.run(main())` instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return
+    try:
+        import uvloop
+    except ImportError:
+        warnings.warn(
+            "NAVER_USE_UVLOOP=1 is set but the uvloop python package is not "
+            "installed; using the default event loop. Install it with "
+            "`pip install uvloop` or unset NAVER_USE_UVLOOP.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+_maybe_install_uvloop()
+
+
+@functools.lru_cache(maxsize=64)
+def _base_url(
+    search_type: str, display: int | None, start: int | None, sort: str | None
+) -> str:
+    """Build the request URL up to the query, which is appended per call."""
+    return (
+        f"{NAVER_API_URL}/{search_type}.json"
+        f"?display={display}&start={start}&sort={sort}&query="
+    )
+
+
+def _build_url(
+    query: str,
+    search_type: str,
+    display: int | None,
+    start: int | None,
+    sort: str | None,
+) -> str:
+    """Append the percent-encoded query to the cached URL prefix."""
+    # Encoding once and quoting the bytes skips quote()'s codec handling
+    enc_text = urllib.parse.quote_from_bytes(query.encode())
+    return _base_url(search_type, display, start, sort) + enc_text
+
+
+def _create_session() -> requests.Session:
+    """Create a session that keeps connections to the API alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across wrappers so consecutive calls reuse the TCP+TLS connection
+_SESSION = _create_session()
+
+# Shared async sessions by event loop, each with the async generator that
+# closes it when the loop shuts down its async generators
+_ASYNC_SESSIONS: dict[
+    asyncio.AbstractEventLoop, tuple[aiohttp.ClientSession, AsyncGenerator]
+] = {}
+
+
+async def _session_owner(
+    loop: asyncio.AbstractEventLoop,
+) -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Yield a new session for ``loop`` and close it once finalized.
+
+    ``asyncio.run`` (and any loop whose ``shutdown_asyncgens`` is called)
+    finalizes the generator before closing the loop, which closes the session
+    while its connections can still be shut down cleanly.
+    """
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+    )
+    try:
+        yield session
+    finally:
+        entry = _ASYNC_SESSIONS.get(loop)
+        if entry is not None and entry[0] is session:
+            del _ASYNC_SESSIONS[loop]
+        await session.close()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared async session for the running loop, creating it once."""
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_SESSIONS.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+
+    # Drop entries for loops that were closed without finalizing their async
+    # generators; their sessions can no longer be closed from here.
+    for stale in [other for other in _ASYNC_SESSIONS if other.is_closed()]:
+        del _ASYNC_SESSIONS[stale]
+
+    owner = _session_owner(loop)
+    # The generator reaches its first yield without suspending, so concurrent
+    # callers on the same loop cannot create duplicate sessions.
+    session = await owner.__anext__()
+    # Keep a strong reference: the loop only tracks its async generators weakly
+    _ASYNC_SESSIONS[loop] = (session, owner)
+    return session
+
+
+@atexit.register
+def _close_async_sessions() -> None:
+    """Close shared async sessions whose loops are still open but idle."""
+    for loop, (session, owner) in list(_ASYNC_SESSIONS.items()):
+        if session.closed or loop.is_closed() or loop.is_running():
+            continue
+        loop.run_until_complete(owner.aclose())
+
 
 class NaverSearchAPIWrapper(BaseModel):
     """Wrapper for Naver Search API."""
 
     naver_client_id: SecretStr
     naver_client_secret: SecretStr
+    # Stream-parse only the items with ijson in raw_results (sync path)
+    use_streaming: bool = False
+
+    # Requests currently in flight, shared by concurrent identical calls
+    _inflight: dict[tuple, asyncio.Future] = PrivateAttr(default_factory=dict)
 
     model_config = ConfigDict(
         extra="forbid",
@@ -59,24 +227,46 @@ class NaverSearchAPIWrapper(BaseModel):
         sort: str | None = "sim",  # sim (similarity) or date
     ) -> dict[str, Any]:
         """Get raw results from the Naver Search API."""
-        enc_text = urllib.parse.quote(query, encoding="utf-8")
-        url = f"{NAVER_API_URL}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
+        url = _build_url(query, search_type, display, start, sort)
 
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", self.naver_client_id.get_secret_value())
-        request.add_header(
-            "X-Naver-Client-Secret", self.naver_client_secret.get_secret_value()
-        )
+        headers = {
+            "X-Naver-Client-Id": self.naver_client_id.get_secret_value(),
+            "X-Naver-Client-Secret": self.naver_client_secret.get_secret_value(),
+        }
+
+        if self.use_streaming:
+            return self._stream_results(url, headers, display)
 
-        response = urllib.request.urlopen(request)
-        response_code = response.getcode()
+        response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
-        if response_code == 200:
-            response_body = response.read().decode("utf-8")
-            return json.loads(response_body)
-        msg = f"Error Code: {response_code}"
+        if response.status_code == 200:
+            return _json_loads(response.content)
+        msg = f"Error Code: {response.status_code}"
         raise Exception(msg)
 
+    def _stream_results(
+        self, url: str, headers: dict[str, str], display: int | None
+    ) -> dict[str, Any]:
+        """Stream-parse at most ``display`` items, skipping the envelope."""
+        try:
+            import ijson
+        except ImportError as e:
+            msg = (
+                "Could not import ijson python package. "
+                "Please install it with `pip install ijson`."
+            )
+            raise ImportError(msg) from e
+
+        with _SESSION.get(
+            url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True
+        ) as response:
+            if response.status_code != 200:
+                msg = f"Error Code: {response.status_code}"
+                raise Exception(msg)
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, "items.item", use_float=True)
+            return {"items": list(itertools.islice(items, display))}
+
     def results(
         self,
         query: str,
@@ -113,28 +303,30 @@ class NaverSearchAPIWrapper(BaseModel):
         display: int | None = 10,
         start: int | None = 1,
         sort: str | None = "sim",
+        session: aiohttp.ClientSession | None = None,
     ) -> dict[str, Any]:
-        """Get results from the Naver Search API asynchronously."""
-        enc_text = urllib.parse.quote(query)
-        url = f"{NAVER_API_URL}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
+        """Get results from the Naver Search API asynchronously.
 
-        async def fetch() -> str:
+        Pass ``session`` to use a specific connection pool, e.g. when issuing
+        several queries concurrently; otherwise the module-level session for
+        the running event loop is reused.
+        """
+        url = _build_url(query, search_type, display, start, sort)
+
+        async def fetch(session: aiohttp.ClientSession) -> bytes:
             headers = {
                 "X-Naver-Client-Id": self.naver_client_id.get_secret_value(),
                 "X-Naver-Client-Secret": self.naver_client_secret.get_secret_value(),
             }
 
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get(url, headers=headers) as response,
-            ):
+            async with session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    return await response.text()
+                    return await response.read()
                 msg = f"Error {response.status}: {response.reason}"
                 raise Exception(msg)
 
-        results_json_str = await fetch()
-        return json.loads(results_json_str)
+        results_json = await fetch(session or await _get_session())
+        return _json_loads(results_json)
 
     async def results_async(
         self,
@@ -143,35 +335,40 @@ class NaverSearchAPIWrapper(BaseModel):
         display: int | None = 10,
         start: int | None = 1,
         sort: str | None = "sim",
+        session: aiohttp.ClientSession | None = None,
     ) -> list[dict[str, Any]]:
-        """Get cleaned results from Naver Search API asynchronously."""
-        results_json = await self.raw_results_async(
-            query=query,
-            search_type=search_type,
-            display=display,
-            start=start,
-            sort=sort,
-        )
-        return self.clean_results(results_json["items"])
+        """Get cleaned results from Naver Search API asynchronously.
+
+        Concurrent calls with identical arguments share a single request.
+        """
+        key = (query, search_type, display, start, sort)
+
+        async def fetch() -> list[dict[str, Any]]:
+            results_json = await self.raw_results_async(
+                query=query,
+                search_type=search_type,
+                display=display,
+                start=start,
+                sort=sort,
+                session=session,
+            )
+            return self.clean_results(results_json["items"])
+
+        return await single_flight(self._inflight, key, fetch)
 
     def clean_results(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Clean results from Naver Search API."""
         clean_results: list[dict[str, Any]] = []
         for result in results:
             # Remove HTML tags from title and description
-            title = result.get("title", "").replace("<b>", "").replace("</b>", "")
-            description = (
-                result.get("description", "").replace("<b>", "").replace("</b>", "")
-            )
-
             clean_result = {
-                "title": title,
+                "title": _strip_tags(result.get("title", "")),
                 "link": result.get("link", ""),
-                "description": description,
+                "description": _strip_tags(result.get("description", "")),
             }
 
             # Add optional fields if they exist
-            for field in ["bloggername", "postdate", "pubDate"]:
+            for field in _OPTIONAL_FIELDS:
                 if field in result:
                     clean_result[field] = result[field]
 
@@ -1,7 +1,12 @@
 """Pytest configuration for langchain-naver-community tests."""
 
+import asyncio
 import os
+import sys
 import pytest
+import pytest_asyncio
+
+from langchain_naver_community import utils
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -9,3 +14,22 @@ def setup_test_environment():
     """Set up test environment variables."""
     os.environ["NAVER_CLIENT_ID"] = "test_client_id"
     os.environ["NAVER_CLIENT_SECRET"] = "test_client_secret"
+    os.environ.pop("NAVER_DISK_CACHE_DIR", None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def default_event_loop_policy():
+    """Run async tests on the stock loop even if NAVER_USE_UVLOOP is set."""
+    # Policies are deprecated from 3.14, where NAVER_USE_UVLOOP never sets one
+    if sys.version_info < (3, 14):
+        asyncio.set_event_loop_policy(None)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_async_session():
+    """Close the shared aiohttp sessions so each test loop gets a fresh one."""
+    yield
+    entry = utils._ASYNC_SESSIONS.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
+    utils._ASYNC_SESSIONS.clear()
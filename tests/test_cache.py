@@ -0,0 +1,155 @@
+"""Tests for result caches."""
+
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langchain_naver_community.cache import (
+    DEFAULT_EMBEDDING_MODEL,
+    SemanticCache,
+    TTLCache,
+    ZstdCodec,
+    default_embedder,
+)
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test basic storage and lookup."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", [1])
+
+        assert cache.get("a") == [1]
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("langchain_naver_community.cache.time.monotonic") as mock_time:
+            mock_time.return_value = 100.0
+            cache.set("a", [1])
+
+            mock_time.return_value = 105.0
+            assert cache.get("a") == [1]
+
+            mock_time.return_value = 111.0
+            assert cache.get("a") is None
+            assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction when the cache is full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_size_disables_cache(self):
+        """Test that maxsize=0 stores nothing."""
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_similar_embedding_hits(self):
+        """Test that a near-identical embedding returns the stored value."""
+        cache = SemanticCache(threshold=0.95)
+        cache.set([1.0, 0.0, 0.0], ("news",), ["result"])
+
+        assert cache.get([0.99, 0.05, 0.0], ("news",)) == ["result"]
+
+    def test_dissimilar_embedding_misses(self):
+        """Test that an unrelated embedding is a miss."""
+        cache = SemanticCache(threshold=0.95)
+        cache.set([1.0, 0.0, 0.0], ("news",), ["result"])
+
+        assert cache.get([0.0, 1.0, 0.0], ("news",)) is None
+
+    def test_params_must_match(self):
+        """Test that entries stored with other search params are ignored."""
+        cache = SemanticCache(threshold=0.95)
+        cache.set([1.0, 0.0, 0.0], ("news",), ["result"])
+
+        assert cache.get([1.0, 0.0, 0.0], ("blog",)) is None
+
+    def test_oldest_entry_is_dropped(self):
+        """Test FIFO eviction when the cache is full."""
+        cache = SemanticCache(threshold=0.95, maxsize=1)
+        cache.set([1.0, 0.0], ("news",), "first")
+        cache.set([0.0, 1.0], ("news",), "second")
+
+        assert len(cache) == 1
+        assert cache.get([1.0, 0.0], ("news",)) is None
+
+
+class TestDefaultEmbedder:
+    """Test cases for default_embedder."""
+
+    def test_model_is_loaded_once(self):
+        """Test that repeated calls share one loaded model."""
+        fake_module = Mock()
+        default_embedder.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
+                first = default_embedder()
+                second = default_embedder()
+        finally:
+            default_embedder.cache_clear()
+
+        assert first is second
+        fake_module.SentenceTransformer.assert_called_once_with(DEFAULT_EMBEDDING_MODEL)
+
+
+class TestZstdCodec:
+    """Test cases for ZstdCodec."""
+
+    @pytest.fixture
+    def sample_results(self):
+        """A display=100 sized page of Korean search results."""
+        return [
+            {
+                "title": f"최신 한국 뉴스 제목 {i}",
+                "link": f"https://news.example.com/article/{i}",
+                "description": "한국의 주요 뉴스와 시사 정보를 전해 드립니다. " * 5,
+                "pubDate": "Tue, 10 Dec 2024 09:30:00 +0900",
+            }
+            for i in range(100)
+        ]
+
+    @pytest.fixture(autouse=True)
+    def _require_zstandard(self):
+        pytest.importorskip("zstandard")
+
+    def test_round_trip(self, sample_results):
+        """Test that decoding restores the encoded results."""
+        codec = ZstdCodec()
+
+        assert codec.decode(codec.encode(sample_results)) == sample_results
+
+    def test_encoded_is_smaller(self, sample_results):
+        """Test that compression shrinks a typical payload."""
+        codec = ZstdCodec()
+        raw_size = sum(
+            sys.getsizeof(value) for item in sample_results for value in item.values()
+        )
+
+        assert sys.getsizeof(codec.encode(sample_results)) * 5 < raw_size
+
+    def test_decode_passes_through_uncompressed(self):
+        """Test that values stored without compression are returned as-is."""
+        assert ZstdCodec().decode([{"title": "a"}]) == [{"title": "a"}]
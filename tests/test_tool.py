@@ -1,7 +1,10 @@
 """Tests for Naver search tools."""
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 import pytest
+from pydantic import ValidationError
 
 from langchain_naver_community.tool import (
     NaverSearchResults,
@@ -9,8 +12,10 @@ from langchain_naver_community.tool import (
     NaverBlogSearch,
     NaverWebSearch,
     NaverBookSearch,
+    _format_error,
+    _parse_pub_date,
 )
-from langchain_naver_community.utils import NaverSearchAPIWrapper
+from langchain_naver_community.utils import REQUEST_TIMEOUT, NaverSearchAPIWrapper
 
 
 class TestNaverSearchResults:
@@ -62,6 +67,30 @@ class TestNaverSearchResults:
         assert tool.start == 5
         assert tool.sort == "date"
 
+    def test_get_cached(self):
+        """Test that get_cached returns one shared instance per arguments."""
+        tool = NaverSearchResults.get_cached(search_type="blog", display=20)
+
+        assert NaverSearchResults.get_cached(display=20, search_type="blog") is tool
+        assert NaverSearchResults.get_cached(search_type="blog") is not tool
+        assert NaverBlogSearch.get_cached(display=20) is not tool
+        assert tool.search_type == "blog"
+        assert tool.display == 20
+
+    def test_get_cached_with_api_wrapper(self):
+        """Test that get_cached accepts a wrapper and matches it by identity."""
+        wrapper = NaverSearchAPIWrapper()
+        tool = NaverSearchResults.get_cached(api_wrapper=wrapper, display=20)
+
+        assert NaverSearchResults.get_cached(api_wrapper=wrapper, display=20) is tool
+        assert (
+            NaverSearchResults.get_cached(
+                api_wrapper=NaverSearchAPIWrapper(), display=20
+            )
+            is not tool
+        )
+        assert tool.api_wrapper is wrapper
+
     def test_run_success(self, search_tool, mock_api_wrapper):
         """Test successful synchronous search."""
         result = search_tool._run("test query")
@@ -77,6 +106,16 @@ class TestNaverSearchResults:
             }
         ]
 
+    def test_run_after_changing_params(self, search_tool, mock_api_wrapper):
+        """Test that changed search parameters are picked up."""
+        search_tool.display = 50
+        search_tool.sort = "date"
+        search_tool._run("test query")
+
+        mock_api_wrapper.results.assert_called_once_with(
+            "test query", search_type="news", display=50, start=1, sort="date"
+        )
+
     def test_run_exception(self, search_tool, mock_api_wrapper):
         """Test handling of exceptions during synchronous search."""
         mock_api_wrapper.results.side_effect = Exception("API Error")
@@ -84,6 +123,20 @@ class TestNaverSearchResults:
         result = search_tool._run("test query")
         assert result == "Exception('API Error')"
 
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Exception("API Error"),
+            ValueError("잘못된 요청"),
+            Exception(),
+            Exception("a", 1),
+            KeyError("items"),
+        ],
+    )
+    def test_format_error_matches_repr(self, error):
+        """Test that error formatting is identical to repr."""
+        assert _format_error(error) == repr(error)
+
     @pytest.mark.asyncio
     async def test_arun_success(self, search_tool, mock_api_wrapper):
         """Test successful asynchronous search."""
@@ -108,6 +161,217 @@ class TestNaverSearchResults:
         result = await search_tool._arun("test query")
         assert result == "Exception('Async API Error')"
 
+    def test_run_uses_cache(self, search_tool, mock_api_wrapper):
+        """Test that repeated queries are served from the cache."""
+        first = search_tool._run("test query")
+        second = search_tool._run("test query")
+
+        assert first == second
+        mock_api_wrapper.results.assert_called_once()
+
+    def test_run_cache_disabled(self, mock_api_wrapper):
+        """Test that a cache size of zero disables caching."""
+        tool = NaverSearchResults(cache_size=0)
+        tool.api_wrapper = mock_api_wrapper
+
+        tool._run("test query")
+        tool._run("test query")
+
+        assert mock_api_wrapper.results.call_count == 2
+
+    def test_run_exception_not_cached(self, search_tool, mock_api_wrapper):
+        """Test that failed calls are not cached."""
+        mock_api_wrapper.results.side_effect = [Exception("API Error"), []]
+
+        assert search_tool._run("test query") == "Exception('API Error')"
+        assert search_tool._run("test query") == []
+
+    @pytest.mark.asyncio
+    async def test_arun_coalesces_concurrent_calls(self, search_tool, mock_api_wrapper):
+        """Test that concurrent identical async calls share one request."""
+        results = await asyncio.gather(
+            *(search_tool._arun("test query") for _ in range(5))
+        )
+
+        mock_api_wrapper.results_async.assert_called_once()
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_arun_coalesces_without_memory_cache(self, mock_api_wrapper):
+        """Test that in-flight calls are shared even with caching disabled."""
+
+        async def slow_results(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return [{"title": "Slow"}]
+
+        mock_api_wrapper.results_async.side_effect = slow_results
+        tool = NaverSearchResults(cache_size=0)
+        tool.api_wrapper = mock_api_wrapper
+
+        results = await asyncio.gather(*(tool._arun("test query") for _ in range(5)))
+
+        mock_api_wrapper.results_async.assert_called_once()
+        assert results == [[{"title": "Slow"}]] * 5
+
+    @pytest.mark.asyncio
+    async def test_arun_cancelled_caller_does_not_cancel_others(
+        self, search_tool, mock_api_wrapper
+    ):
+        """Test that a timed-out caller leaves the shared request running."""
+
+        async def slow_results(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return [{"title": "Slow"}]
+
+        mock_api_wrapper.results_async.side_effect = slow_results
+
+        async def impatient():
+            return await asyncio.wait_for(search_tool._arun("test query"), 0.01)
+
+        impatient_result, patient_result = await asyncio.gather(
+            impatient(), search_tool._arun("test query"), return_exceptions=True
+        )
+
+        assert isinstance(impatient_result, asyncio.TimeoutError)
+        assert patient_result == [{"title": "Slow"}]
+        mock_api_wrapper.results_async.assert_called_once()
+
+    def test_run_returns_copies(self, search_tool):
+        """Test that modifying returned results does not corrupt the cache."""
+        first = search_tool._run("test query")
+        first[0]["title"] = "Changed"
+        first.clear()
+
+        assert search_tool._run("test query")[0]["title"] == "Test Title"
+
+    @pytest.mark.asyncio
+    async def test_arun_many(self, search_tool, mock_api_wrapper):
+        """Test that several queries run over one shared session."""
+        mock_api_wrapper.results_async.side_effect = [
+            [{"title": "First"}],
+            Exception("API Error"),
+        ]
+
+        results = await search_tool.arun_many(["first", "second"])
+
+        assert results == [[{"title": "First"}], "Exception('API Error')"]
+        sessions = {
+            call.kwargs["session"]
+            for call in mock_api_wrapper.results_async.call_args_list
+        }
+        assert len(sessions) == 1
+        assert sessions.pop().timeout.total == REQUEST_TIMEOUT
+
+    def test_run_disk_cache(self, mock_api_wrapper, tmp_path):
+        """Test that results persist on disk across tool instances."""
+        pytest.importorskip("diskcache")
+        first_tool = NaverSearchResults(disk_cache_dir=str(tmp_path))
+        first_tool.api_wrapper = mock_api_wrapper
+        first = first_tool._run("test query")
+
+        # A new instance has an empty memory cache but reads the same directory
+        second_tool = NaverSearchResults(disk_cache_dir=str(tmp_path))
+        second_tool.api_wrapper = mock_api_wrapper
+        second = second_tool._run("test query")
+
+        assert first == second
+        mock_api_wrapper.results.assert_called_once()
+
+    def test_run_disk_cache_compressed_read_uncompressed(
+        self, mock_api_wrapper, tmp_path
+    ):
+        """Test that compressed disk entries decode with compression off."""
+        pytest.importorskip("diskcache")
+        pytest.importorskip("zstandard")
+        writer = NaverSearchResults(disk_cache_dir=str(tmp_path), compress_cache=True)
+        writer.api_wrapper = mock_api_wrapper
+        first = writer._run("test query")
+
+        reader = NaverSearchResults(disk_cache_dir=str(tmp_path))
+        reader.api_wrapper = mock_api_wrapper
+        second = reader._run("test query")
+
+        assert first == second == mock_api_wrapper.results.return_value
+        mock_api_wrapper.results.assert_called_once()
+
+    def test_run_compressed_cache(self, mock_api_wrapper):
+        """Test that compressed cache entries are decoded on a hit."""
+        pytest.importorskip("zstandard")
+        tool = NaverSearchResults(compress_cache=True)
+        tool.api_wrapper = mock_api_wrapper
+
+        first = tool._run("test query")
+        second = tool._run("test query")
+
+        assert first == second == mock_api_wrapper.results.return_value
+        mock_api_wrapper.results.assert_called_once()
+
+    def test_run_semantic_cache(self, mock_api_wrapper):
+        """Test that paraphrased queries reuse cached results."""
+        pytest.importorskip("numpy")
+        embeddings = {"최신 뉴스": [1.0, 0.0], "최근 뉴스": [0.99, 0.1]}
+        tool = NaverSearchResults(semantic_cache=True, embedder=embeddings.get)
+        tool.api_wrapper = mock_api_wrapper
+
+        first = tool._run("최신 뉴스")
+        second = tool._run("최근 뉴스")
+
+        assert first == second
+        mock_api_wrapper.results.assert_called_once()
+
+    def test_semantic_cache_loads_default_embedder_lazily(self, mock_api_wrapper):
+        """Test that the default model loads on the first lookup, not at init."""
+        pytest.importorskip("numpy")
+        embeddings = {"최신 뉴스": [1.0, 0.0], "최근 뉴스": [0.99, 0.1]}
+        with patch(
+            "langchain_naver_community.tool.default_embedder",
+            return_value=embeddings.get,
+        ) as mock_default:
+            tool = NaverSearchResults(semantic_cache=True)
+            tool.api_wrapper = mock_api_wrapper
+            mock_default.assert_not_called()
+
+            first = tool._run("최신 뉴스")
+            second = tool._run("최근 뉴스")
+
+        assert first == second
+        assert mock_default.called
+        assert tool.embedder is None
+        mock_api_wrapper.results.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_arun_semantic_cache_embeds_off_loop(self, mock_api_wrapper):
+        """Test that the async path runs the embedder outside the event loop."""
+        pytest.importorskip("numpy")
+        loop_thread = threading.get_ident()
+        embed_threads = []
+
+        def embedder(query):
+            embed_threads.append(threading.get_ident())
+            return {"최신 뉴스": [1.0, 0.0], "최근 뉴스": [0.99, 0.1]}[query]
+
+        tool = NaverSearchResults(semantic_cache=True, embedder=embedder)
+        tool.api_wrapper = mock_api_wrapper
+
+        first = await tool._arun("최신 뉴스")
+        second = await tool._arun("최근 뉴스")
+
+        assert first == second
+        mock_api_wrapper.results_async.assert_called_once()
+        assert embed_threads and loop_thread not in embed_threads
+
+    def test_model_copy_rebinds_and_gets_own_cache(self, search_tool, mock_api_wrapper):
+        """Test that model_copy(update=...) uses the updated params and a new cache."""
+        search_tool._run("test query")
+        copied = search_tool.model_copy(update={"display": 50})
+
+        copied._run("test query")
+
+        assert mock_api_wrapper.results.call_count == 2
+        assert mock_api_wrapper.results.call_args.kwargs["display"] == 50
+        assert copied._cache is not search_tool._cache
+        assert copied._inflight is not search_tool._inflight
+
     def test_invoke_with_dict(self, search_tool):
         """Test invoking the tool with a dictionary input."""
         result = search_tool.invoke({"query": "test query"})
@@ -118,6 +382,14 @@ class TestNaverSearchResults:
         result = search_tool.invoke("test query")
         assert isinstance(result, list)
 
+    def test_parse_input(self, search_tool):
+        """Test that dict input is validated and reduced to the query."""
+        parsed = search_tool._parse_input({"query": "test query", "extra": 1}, None)
+        assert parsed == {"query": "test query"}
+
+        with pytest.raises(ValidationError):
+            search_tool._parse_input({"query": 1}, None)
+
 
 class TestSpecializedSearchTools:
     """Test cases for specialized search tools."""
@@ -157,6 +429,31 @@ class TestSpecializedSearchTools:
         assert len(result) >= 1
         assert any("Test News" in str(item) for item in result)
 
+    def test_naver_news_search_date_filter_excludes_other_dates(self):
+        """Test that news from other dates is filtered out."""
+        wrapper = Mock(spec=NaverSearchAPIWrapper)
+        wrapper.results.return_value = [
+            {"link": "1", "pubDate": "Tue, 10 Dec 2024 09:30:00 +0900"},
+            {"link": "2", "pubDate": "Wed, 11 Dec 2024 10:30:00 +0900"},
+            {"link": "3", "pubDate": "not a date"},
+            {"link": "4"},
+        ]
+
+        tool = NaverNewsSearch()
+        tool.api_wrapper = wrapper
+
+        result = tool._run("test query", target_date="2024-12-10", min_results=5)
+
+        # Unparsable or missing dates are kept as a fallback
+        assert [item["link"] for item in result] == ["1", "3", "4"]
+
+    def test_parse_pub_date(self):
+        """Test parsing of Naver's RFC 822 pubDate."""
+        assert _parse_pub_date("Tue, 10 Dec 2024 09:30:00 +0900") == (2024, 12, 10)
+        assert _parse_pub_date("Mon, 1 Jan 2024 00:00:00 +0900") == (2024, 1, 1)
+        with pytest.raises(KeyError):
+            _parse_pub_date("Tue, 10 Foo 2024 09:30:00 +0900")
+
     def test_naver_news_search_invalid_date(self):
         """Test NaverNewsSearch with invalid date format."""
         tool = NaverNewsSearch()
@@ -181,6 +478,40 @@ class TestSpecializedSearchTools:
         )
         assert result == [{"title": "Test News"}]
 
+    def test_naver_news_search_no_date_filter_uses_cache(self):
+        """Test that searches without a date are cached per min_results."""
+        wrapper = Mock(spec=NaverSearchAPIWrapper)
+        wrapper.results.return_value = [{"title": "Test News"}]
+
+        tool = NaverNewsSearch()
+        tool.api_wrapper = wrapper
+
+        first = tool._run("test query", min_results=20)
+        second = tool._run("test query", min_results=20)
+        tool._run("test query", min_results=5)
+
+        assert first == second == [{"title": "Test News"}]
+        assert wrapper.results.call_count == 2
+        assert wrapper.results.call_args_list[0].kwargs["display"] == 20
+        assert wrapper.results.call_args_list[1].kwargs["display"] == 5
+
+    @pytest.mark.asyncio
+    async def test_naver_news_search_async_no_date_filter_uses_cache(self):
+        """Test that async searches without a date are cached."""
+        wrapper = Mock(spec=NaverSearchAPIWrapper)
+        wrapper.results_async = AsyncMock(return_value=[{"title": "Async News"}])
+
+        tool = NaverNewsSearch()
+        tool.api_wrapper = wrapper
+
+        first = await tool._arun("test query", min_results=20)
+        second = await tool._arun("test query", min_results=20)
+
+        assert first == second == [{"title": "Async News"}]
+        wrapper.results_async.assert_called_once_with(
+            "test query", search_type="news", display=20, start=1, sort="sim"
+        )
+
     @pytest.mark.asyncio
     async def test_naver_news_search_async_with_date(self):
         """Test NaverNewsSearch async with date filtering."""
@@ -1,10 +1,21 @@
 """Tests for Naver Search API utils."""
 
+import asyncio
+import io
 import json
-from unittest.mock import AsyncMock, Mock, patch
+import sys
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
-from langchain_naver_community.utils import NaverSearchAPIWrapper
+from langchain_naver_community import utils
+from langchain_naver_community.utils import (
+    _SESSION,
+    NaverSearchAPIWrapper,
+    _get_session,
+    _maybe_install_uvloop,
+)
 
 
 class TestNaverSearchAPIWrapper:
@@ -57,38 +68,38 @@ class TestNaverSearchAPIWrapper:
             api_wrapper.naver_client_secret.get_secret_value() == "test_client_secret"
         )
 
-    @patch("urllib.request.urlopen")
-    def test_raw_results_success(self, mock_urlopen, api_wrapper, mock_response_data):
+    @patch("requests.Session.get")
+    def test_raw_results_success(self, mock_get, api_wrapper, mock_response_data):
         """Test successful raw_results call."""
         mock_response = Mock()
-        mock_response.getcode.return_value = 200
-        mock_response.read.return_value = json.dumps(mock_response_data).encode("utf-8")
-        mock_urlopen.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(mock_response_data).encode("utf-8")
+        mock_get.return_value = mock_response
 
         result = api_wrapper.raw_results("test query")
 
         assert result == mock_response_data
-        mock_urlopen.assert_called_once()
+        mock_get.assert_called_once()
 
-    @patch("urllib.request.urlopen")
-    def test_raw_results_error(self, mock_urlopen, api_wrapper):
+    @patch("requests.Session.get")
+    def test_raw_results_error(self, mock_get, api_wrapper):
         """Test raw_results with API error."""
         mock_response = Mock()
-        mock_response.getcode.return_value = 400
-        mock_urlopen.return_value = mock_response
+        mock_response.status_code = 400
+        mock_get.return_value = mock_response
 
         with pytest.raises(Exception, match="Error Code: 400"):
             api_wrapper.raw_results("test query")
 
-    @patch("urllib.request.urlopen")
+    @patch("requests.Session.get")
     def test_results_with_different_params(
-        self, mock_urlopen, api_wrapper, mock_response_data
+        self, mock_get, api_wrapper, mock_response_data
     ):
         """Test results method with different parameters."""
         mock_response = Mock()
-        mock_response.getcode.return_value = 200
-        mock_response.read.return_value = json.dumps(mock_response_data).encode("utf-8")
-        mock_urlopen.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(mock_response_data).encode("utf-8")
+        mock_get.return_value = mock_response
 
         result = api_wrapper.results(
             "test query", search_type="blog", display=20, start=5, sort="date"
@@ -98,6 +109,30 @@ class TestNaverSearchAPIWrapper:
         assert result[0]["title"] == "Test News Title"  # HTML tags removed
         assert result[0]["description"] == "Test news description"  # HTML tags removed
 
+    @patch("requests.Session.get")
+    def test_raw_results_streaming(self, mock_get, mock_response_data):
+        """Test that streaming parses at most `display` items."""
+        pytest.importorskip("ijson")
+        api_wrapper = NaverSearchAPIWrapper(
+            naver_client_id="test_client_id",
+            naver_client_secret="test_client_secret",
+            use_streaming=True,
+        )
+        payload = {
+            "lastBuildDate": "Tue, 10 Dec 2024",
+            "total": 2,
+            **mock_response_data,
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        result = api_wrapper.raw_results("test query", display=1)
+
+        assert result == {"items": mock_response_data["items"][:1]}
+        assert mock_get.call_args[1]["stream"] is True
+
     def test_clean_results(self, api_wrapper):
         """Test clean_results method."""
         raw_results = [
@@ -135,7 +170,9 @@ class TestNaverSearchAPIWrapper:
         """Test successful async raw_results call."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value=json.dumps(mock_response_data))
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(mock_response_data).encode("utf-8")
+        )
         mock_get.return_value.__aenter__.return_value = mock_response
 
         result = await api_wrapper.raw_results_async("test query")
@@ -160,7 +197,9 @@ class TestNaverSearchAPIWrapper:
         """Test async results method."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value=json.dumps(mock_response_data))
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(mock_response_data).encode("utf-8")
+        )
         mock_get.return_value.__aenter__.return_value = mock_response
 
         result = await api_wrapper.results_async("test query")
@@ -169,52 +208,255 @@ class TestNaverSearchAPIWrapper:
         assert result[0]["title"] == "Test News Title"
         assert result[1]["title"] == "Another Article"
 
-    def test_url_encoding(self, api_wrapper):
-        """Test that queries are properly URL encoded."""
-        with patch("urllib.request.urlopen") as mock_urlopen:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_results_async_single_flight(
+        self, mock_get, api_wrapper, mock_response_data
+    ):
+        """Test that concurrent identical calls share one HTTP request."""
+
+        async def slow_read():
+            await asyncio.sleep(0.01)
+            return json.dumps(mock_response_data).encode("utf-8")
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = slow_read
+        mock_get.return_value.__aenter__.return_value = mock_response
+
+        results = await asyncio.gather(
+            *(api_wrapper.results_async("test query") for _ in range(10))
+        )
+
+        mock_get.assert_called_once()
+        assert all(result == results[0] for result in results)
+        assert len(results[0]) == 2
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_results_async_single_flight_error(self, mock_get, api_wrapper):
+        """Test that a failed shared request raises in every caller."""
+
+        mock_response = AsyncMock()
+        mock_response.status = 500
+        mock_response.reason = "Server Error"
+
+        async def slow_enter(*args):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_get.return_value.__aenter__.side_effect = slow_enter
+
+        results = await asyncio.gather(
+            *(api_wrapper.results_async("test query") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        mock_get.assert_called_once()
+        assert all("Error 500" in str(result) for result in results)
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_results_async_cancelled_caller_does_not_cancel_others(
+        self, mock_get, api_wrapper, mock_response_data
+    ):
+        """Test that cancelling the first caller leaves the shared request running."""
+
+        async def slow_read():
+            await asyncio.sleep(0.1)
+            return json.dumps(mock_response_data).encode("utf-8")
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = slow_read
+        mock_get.return_value.__aenter__.return_value = mock_response
+
+        # The impatient caller starts the shared request, then times out
+        impatient = asyncio.ensure_future(
+            asyncio.wait_for(api_wrapper.results_async("test query"), 0.05)
+        )
+        await asyncio.sleep(0.01)
+        result = await api_wrapper.results_async("test query")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await impatient
+        assert len(result) == 2
+        mock_get.assert_called_once()
+
+    @patch("aiohttp.ClientSession.get")
+    def test_results_async_single_flight_per_loop(
+        self, mock_get, api_wrapper, mock_response_data
+    ):
+        """Test that calls on separate loops in two threads don't share a task."""
+
+        async def slow_read():
+            await asyncio.sleep(0.1)
+            return json.dumps(mock_response_data).encode("utf-8")
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = slow_read
+        mock_get.return_value.__aenter__.return_value = mock_response
+
+        outcomes = []
+
+        def run_in_thread():
+            try:
+                outcomes.append(asyncio.run(api_wrapper.results_async("test query")))
+            except Exception as e:
+                outcomes.append(e)
+
+        first = threading.Thread(target=run_in_thread)
+        first.start()
+        time.sleep(0.02)  # Let the first request go in flight
+        second = threading.Thread(target=run_in_thread)
+        second.start()
+        first.join()
+        second.join()
+
+        assert [len(outcome) for outcome in outcomes] == [2, 2]
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_results_async_with_session(self, api_wrapper, mock_response_data):
+        """Test that an injected session is used instead of a new one."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(mock_response_data).encode("utf-8")
+        )
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = mock_response
+
+        with patch("aiohttp.ClientSession") as mock_session_cls:
+            result = await api_wrapper.results_async("test query", session=session)
+
+        mock_session_cls.assert_not_called()
+        session.get.assert_called_once()
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_session_is_reused(self):
+        """Test that async calls on one loop share a single session."""
+        first = await _get_session()
+        second = await _get_session()
+
+        assert first is second
+        assert not first.closed
+
+    def test_async_session_closed_with_loop(self):
+        """Test that each asyncio.run gets its own session, closed at shutdown."""
+        sessions = []
+
+        async def use_session():
+            sessions.append(await _get_session())
+
+        for _ in range(3):
+            asyncio.run(use_session())
+
+        assert len({id(session) for session in sessions}) == 3
+        assert all(session.closed for session in sessions)
+        assert not utils._ASYNC_SESSIONS
+
+    def test_uvloop_is_opt_in(self):
+        """Test that uvloop is only installed when NAVER_USE_UVLOOP=1."""
+        with (
+            patch.dict("os.environ", {"NAVER_USE_UVLOOP": "0"}),
+            patch("asyncio.set_event_loop_policy") as mock_set_policy,
+        ):
+            _maybe_install_uvloop()
+        mock_set_policy.assert_not_called()
+
+    @patch("asyncio.set_event_loop_policy")
+    def test_uvloop_install(self, mock_set_policy):
+        """Test that NAVER_USE_UVLOOP=1 installs the uvloop policy."""
+        uvloop = pytest.importorskip("uvloop")
+        with (
+            patch.dict("os.environ", {"NAVER_USE_UVLOOP": "1"}),
+            patch("platform.system", return_value="Linux"),
+            patch.object(sys, "version_info", (3, 12)),
+        ):
+            _maybe_install_uvloop()
+
+        assert isinstance(mock_set_policy.call_args[0][0], uvloop.EventLoopPolicy)
+
+    def test_uvloop_missing_warns(self):
+        """Test that a missing uvloop warns instead of failing the import."""
+        with (
+            patch.dict("os.environ", {"NAVER_USE_UVLOOP": "1"}),
+            patch.dict("sys.modules", {"uvloop": None}),
+            patch("platform.system", return_value="Linux"),
+            patch.object(sys, "version_info", (3, 12)),
+            patch("asyncio.set_event_loop_policy") as mock_set_policy,
+            pytest.warns(RuntimeWarning, match="uvloop python package"),
+        ):
+            _maybe_install_uvloop()
+        mock_set_policy.assert_not_called()
+
+    def test_uvloop_policy_skipped_on_python_314(self):
+        """Test that no loop policy is set where policies are deprecated."""
+        with (
+            patch.dict("os.environ", {"NAVER_USE_UVLOOP": "1"}),
+            patch("platform.system", return_value="Linux"),
+            patch.object(sys, "version_info", (3, 14)),
+            patch("asyncio.set_event_loop_policy") as mock_set_policy,
+            pytest.warns(RuntimeWarning, match="uvloop.run"),
+        ):
+            _maybe_install_uvloop()
+        mock_set_policy.assert_not_called()
+
+    @pytest.fixture
+    def mock_get(self):
+        """Patch the pooled session to return an empty result."""
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
-            mock_response.getcode.return_value = 200
-            mock_response.read.return_value = b'{"items": []}'
-            mock_urlopen.return_value = mock_response
-
-            # Test with special characters and Korean text
-            api_wrapper.raw_results("테스트 쿼리 with spaces & symbols")
-
-            # Verify the URL was properly encoded
-            call_args = mock_urlopen.call_args[0][0]
-            assert (
-                "테스트" not in call_args.full_url
-            )  # Korean characters should be encoded
-            assert (
-                "%20" in call_args.full_url or "+" in call_args.full_url
-            )  # Spaces should be encoded
-
-    def test_search_type_parameter(self, api_wrapper):
+            mock_response.status_code = 200
+            mock_response.content = b'{"items": []}'
+            mock_get.return_value = mock_response
+            yield mock_get
+
+    def test_url_encoding(self, api_wrapper, mock_get):
+        """Test that queries are properly URL encoded."""
+        # Test with special characters and Korean text
+        api_wrapper.raw_results("테스트 쿼리 with spaces & symbols")
+
+        # Verify the URL was properly encoded
+        url = mock_get.call_args[0][0]
+        assert "테스트" not in url  # Korean characters should be encoded
+        assert "%20" in url or "+" in url  # Spaces should be encoded
+
+    def test_search_type_parameter(self, api_wrapper, mock_get):
         """Test different search types in URL construction."""
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = Mock()
-            mock_response.getcode.return_value = 200
-            mock_response.read.return_value = b'{"items": []}'
-            mock_urlopen.return_value = mock_response
+        search_types = ["news", "blog", "webkr", "book"]
+
+        for search_type in search_types:
+            api_wrapper.raw_results("test", search_type=search_type)
+            url = mock_get.call_args[0][0]
+            assert f"/{search_type}.json" in url
 
-            search_types = ["news", "blog", "webkr", "book"]
+    def test_url_parameters(self, api_wrapper, mock_get):
+        """Test that all search parameters end up in the URL."""
+        api_wrapper.raw_results("뉴스", search_type="blog", display=20, sort="date")
 
-            for search_type in search_types:
-                api_wrapper.raw_results("test", search_type=search_type)
-                call_args = mock_urlopen.call_args[0][0]
-                assert f"/{search_type}.json" in call_args.full_url
+        url = mock_get.call_args[0][0]
+        assert url == (
+            "https://openapi.naver.com/v1/search/blog.json"
+            "?display=20&start=1&sort=date&query=%EB%89%B4%EC%8A%A4"
+        )
 
-    def test_headers_in_request(self, api_wrapper):
+    def test_headers_in_request(self, api_wrapper, mock_get):
         """Test that proper headers are set in the request."""
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = Mock()
-            mock_response.getcode.return_value = 200
-            mock_response.read.return_value = b'{"items": []}'
-            mock_urlopen.return_value = mock_response
+        api_wrapper.raw_results("test")
+
+        headers = mock_get.call_args[1]["headers"]
+        assert headers.get("X-Naver-Client-Id") == "test_client_id"
+        assert headers.get("X-Naver-Client-Secret") == "test_client_secret"
 
-            api_wrapper.raw_results("test")
+    def test_session_is_reused(self, api_wrapper, mock_get):
+        """Test that consecutive calls share the pooled session."""
+        api_wrapper.raw_results("first")
+        api_wrapper.raw_results("second")
 
-            request = mock_urlopen.call_args[0][0]
-            headers = request.headers
-            assert headers.get("X-naver-client-id") == "test_client_id"
-            assert headers.get("X-naver-client-secret") == "test_client_secret"
+        assert mock_get.call_count == 2
+        adapter = _SESSION.get_adapter("https://openapi.naver.com")
+        assert adapter._pool_maxsize == 20